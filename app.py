@@ -6,18 +6,62 @@ A Flask web application that displays now-playing information from
 shairport-sync via MQTT and provides transport controls.
 """
 
+# Monkey-patch before anything imports sockets/threading so paho's
+# network loop and the SSE connections cooperate on one gevent event
+# loop under the gevent gunicorn worker. Optional: without gevent the
+# app runs threaded exactly as before.
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
+import gzip
 import json
 import queue
 import socket
+import threading
+import time
 import yaml
+from dataclasses import dataclass
+
+# libyaml-backed loader parses several times faster than the pure-Python
+# one; fall back where PyYAML was built without it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 import paho.mqtt.client as mqtt
 from paho.mqtt.enums import CallbackAPIVersion
-from flask import Flask, render_template, jsonify, redirect, Response
+from flask import Flask, render_template, jsonify, redirect, request, Response
+
+# orjson serializes JSON several times faster than stdlib and returns
+# bytes directly; fall back to stdlib where it isn't installed
+try:
+    import orjson
+
+    def json_dumps_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def json_dumps_bytes(obj):
+        return json.dumps(obj).encode("utf-8")
 
 app = Flask(__name__)
 
-# Global state for current playback
+# Internal playback bookkeeping: raw RTP timestamps plus the change
+# counter the broadcaster keys its memoization on
 state = {
+    "progress_start": 0,
+    "progress_current": 0,
+    "progress_end": 0,
+    "version": 0,  # Incremented on every observable state change
+}
+
+# The client-facing state view. Handlers update the affected fields in
+# place as messages arrive, so broadcasts serialize this dict directly
+# instead of rebuilding it (and redoing the progress arithmetic) per
+# tick. Treat as read-only outside the handlers.
+_view = {
     "active": False,
     "artist": "",
     "album": "",
@@ -25,17 +69,31 @@ state = {
     "genre": "",
     "volume": "",
     "client_name": "",
-    "cover_art": None,  # Binary image data
-    "cover_art_type": "image/jpeg",
-    "cover_version": 0,  # Incremented when cover changes
-    "progress_start": 0,
-    "progress_current": 0,
-    "progress_end": 0,
-    "progress_version": 0,  # Incremented when progress changes
+    "has_cover": False,
+    "cover_version": 0,
+    "duration": 0,
+    "elapsed": 0,
+    "remaining": 0,
     "shuffle": False,  # Shuffle mode
     "repeat": False,   # Repeat mode
 }
 
+
+@dataclass
+class Cover:
+    """Current cover art, kept out of the broadcast state dict so the
+    multi-hundred-KB blob lives behind its own lock."""
+    data: bytes = b""
+    mime: str = "image/jpeg"
+    version: int = 0  # Incremented when cover changes
+
+
+# Seed the version from the clock so the /api/cover?v=N namespace is
+# unique across restarts: browsers cache versioned covers as immutable,
+# and a counter restarting at 0 would alias a previous process's images
+_cover = Cover(version=int(time.time()))
+_cover_lock = threading.Lock()
+
 # Audio sample rate (standard for AirPlay)
 SAMPLE_RATE = 44100
 
@@ -43,58 +101,108 @@ SAMPLE_RATE = 44100
 mqtt_client = None
 config = None
 
-# SSE clients - list of queues for connected clients
-sse_clients = []
+# Topic strings cached at setup_mqtt() time (config is immutable after init)
+BASE_TOPIC_SLASH = ""
+BASE_TOPIC_SLASH_LEN = 0
+REMOTE_TOPIC = ""
+
+# SSE clients - set of queues for connected clients (O(1) add/discard)
+sse_clients = set()
+
+# Broadcast coalescing - set when state changes, cleared by the broadcaster
+_dirty = threading.Event()
+
+# Coalescing window: state changes arriving within this interval are
+# collapsed into a single broadcast (caps fanout at ~20 Hz)
+BROADCAST_INTERVAL = 0.05
 
 
 def load_config(config_path="config.yaml"):
     """Load configuration from YAML file."""
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlSafeLoader)
 
 
 def get_state_dict():
-    """Build and return current state as a dictionary."""
-    duration = 0
-    elapsed = 0
-    remaining = 0
-    if state["progress_end"] > state["progress_start"]:
-        duration = (state["progress_end"] - state["progress_start"]) / SAMPLE_RATE
-        elapsed = (state["progress_current"] - state["progress_start"]) / SAMPLE_RATE
-        remaining = max(0, duration - elapsed)
-
-    return {
-        "active": state["active"],
-        "artist": state["artist"],
-        "album": state["album"],
-        "title": state["title"],
-        "genre": state["genre"],
-        "volume": state["volume"],
-        "client_name": state["client_name"],
-        "has_cover": state["cover_art"] is not None,
-        "cover_version": state["cover_version"],
-        "duration": round(duration, 1),
-        "elapsed": round(elapsed, 1),
-        "remaining": round(remaining, 1),
-        "shuffle": state["shuffle"],
-        "repeat": state["repeat"],
-    }
+    """Return the current state view (live dict - treat as read-only)."""
+    return _view
 
 
 def notify_clients():
-    """Send current state to all connected SSE clients."""
-    state_data = get_state_dict()
-    message = f"data: {json.dumps(state_data)}\n\n"
-    dead_clients = []
-    for client_queue in sse_clients:
-        try:
-            client_queue.put_nowait(message)
-        except queue.Full:
-            dead_clients.append(client_queue)
-    # Remove dead clients
-    for dead in dead_clients:
-        if dead in sse_clients:
-            sse_clients.remove(dead)
+    """Mark state as changed; the broadcaster thread picks it up."""
+    _dirty.set()
+
+
+def broadcast_loop():
+    """Coalesce state changes and fan out to SSE clients.
+
+    Runs in a daemon thread. Waits for a state change, sleeps out the
+    coalescing window so bursts (e.g. metadata on track change) collapse
+    into one broadcast, then serializes the state once and pushes the
+    same message to every client queue.
+
+    Each client queue holds at most one message: SSE is a projection of
+    the latest state, so stale snapshots are dropped rather than queued
+    for slow clients (latest-wins).
+
+    Serialization is memoized on state["version"]: if nothing observable
+    changed since the last broadcast (e.g. a duplicate progress tick),
+    the JSON encode and fanout are skipped entirely.
+
+    Broadcasts are deltas: only fields that changed since the last
+    broadcast are sent (during steady playback that's just elapsed/
+    remaining). Each client receives the full state once on connect and
+    merges patches from there.
+    """
+    last_sent_version = -1
+    last_sent = {}
+    while True:
+        _dirty.wait()
+        time.sleep(BROADCAST_INTERVAL)
+        _dirty.clear()
+        if state["version"] == last_sent_version:
+            continue
+        last_sent_version = state["version"]
+        diff = {k: v for k, v in _view.items() if last_sent.get(k) != v}
+        if not diff:
+            continue
+        last_sent.update(diff)
+        message = b"data: " + json_dumps_bytes(diff) + b"\n\n"
+        full_message = None
+        dead_clients = []
+        for client_queue in list(sse_clients):
+            try:
+                # Drain any unconsumed message so the latest state wins.
+                # A drained message was a patch this client never saw,
+                # so it gets the full state instead of just the delta.
+                try:
+                    client_queue.get_nowait()
+                except queue.Empty:
+                    client_queue.put_nowait(message)
+                else:
+                    if full_message is None:
+                        full_message = b"data: " + json_dumps_bytes(_view) + b"\n\n"
+                    client_queue.put_nowait(full_message)
+            except queue.Full:
+                dead_clients.append(client_queue)
+        # Remove dead clients
+        for dead in dead_clients:
+            sse_clients.discard(dead)
+
+
+def subscription_topics(base_topic):
+    """Build the explicit subscription list from the handled topic keys.
+
+    shairport-sync publishes some topics flat (artist, play_start, ...)
+    and some nested under ssnc/ (prgr, pbeg, ...) depending on version
+    and configuration, so both forms are subscribed. Everything else
+    (the many diagnostic topics) never leaves the broker.
+    """
+    topics = []
+    for key in HANDLERS:
+        topics.append((f"{base_topic}/{key}", 0))
+        topics.append((f"{base_topic}/ssnc/{key}", 0))
+    return topics
 
 
 def on_connect(client, userdata, flags, reason_code, properties=None):
@@ -103,109 +211,201 @@ def on_connect(client, userdata, flags, reason_code, properties=None):
         print(f"Failed to connect to MQTT broker, code: {reason_code}")
     else:
         print("Connected to MQTT broker")
-        # Subscribe to all shairport topics
+        # Subscribe only to the topics we handle, not base_topic/#
         base_topic = config["mqtt"]["topic"]
-        client.subscribe(f"{base_topic}/#")
-        print(f"Subscribed to {base_topic}/#")
+        topics = subscription_topics(base_topic)
+        client.subscribe(topics)
+        print(f"Subscribed to {len(topics)} topics under {base_topic}/")
+
+
+# --- Message handlers ----------------------------------------------------
+# Each handler takes the raw payload and mutates state. A handler returns
+# False to suppress client notification; any other return notifies.
+
+def _set_str(key):
+    """Build a handler that stores the payload as a UTF-8 string."""
+    def handler(payload):
+        _view[key] = payload.decode("utf-8", errors="ignore")
+        state["version"] += 1
+    return handler
+
+
+def _handle_volume(payload):
+    _view["volume"] = payload.decode("utf-8", errors="ignore")
+    state["version"] += 1
+    # Don't notify for volume-only changes to avoid resetting progress display
+    return False
+
+
+# Image signatures for cover art type detection (longest prefix is 8 bytes)
+MAGIC_BYTES = {
+    b'\xff\xd8\xff': "image/jpeg",
+    b'\x89PNG\r\n\x1a\n': "image/png",
+    b'GIF8': "image/gif",
+    b'RIFF': "image/webp",
+}
+
+
+def _handle_cover(payload):
+    # Cover art is sent as binary data
+    if payload and len(payload) > 0:
+        # Detect image type from magic bytes; startswith on the payload
+        # itself avoids slicing a temporary head buffer
+        mime = _cover.mime
+        for signature, mimetype in MAGIC_BYTES.items():
+            if payload.startswith(signature):
+                mime = mimetype
+                break
+        with _cover_lock:
+            _cover.data = payload
+            _cover.mime = mime
+            _cover.version += 1
+        _view["has_cover"] = True
+        _view["cover_version"] = _cover.version
+        state["version"] += 1
+
+
+def _handle_prgr(payload):
+    # Progress: "start/current/end" as RTP timestamps. The payload is
+    # ASCII digits and slashes, so split the bytes directly - int()
+    # accepts bytes, skipping the str decode on this 1Hz path.
+    try:
+        parts = payload.split(b"/")
+        if len(parts) == 3:
+            # Only bump version when the whole second changes - the UI
+            # interpolates between ticks, so sub-second updates are noise
+            old_second = (state["progress_current"] - state["progress_start"]) // SAMPLE_RATE
+            state["progress_start"] = int(parts[0])
+            state["progress_current"] = int(parts[1])
+            state["progress_end"] = int(parts[2])
+            new_second = (state["progress_current"] - state["progress_start"]) // SAMPLE_RATE
+            changed = new_second != old_second or not _view["active"]
+            # Recompute the derived view fields in place
+            if state["progress_end"] > state["progress_start"]:
+                duration = (state["progress_end"] - state["progress_start"]) / SAMPLE_RATE
+                elapsed = (state["progress_current"] - state["progress_start"]) / SAMPLE_RATE
+                _view["duration"] = round(duration, 1)
+                _view["elapsed"] = round(elapsed, 1)
+                _view["remaining"] = round(max(0, duration - elapsed), 1)
+            else:
+                _view["duration"] = _view["elapsed"] = _view["remaining"] = 0
+            # Receiving progress means we're actively playing
+            _view["active"] = True
+            # Bump last, after every _view write, so the broadcaster can
+            # never record this version with a half-updated view
+            if changed:
+                state["version"] += 1
+    except ValueError:
+        pass
+
+
+def _handle_active_start(payload):
+    _view["active"] = True
+    state["version"] += 1
+    print("Playback session started")
+
+
+def _handle_active_end(payload):
+    _view["active"] = False
+    # Clear metadata on session end
+    _view["artist"] = ""
+    _view["album"] = ""
+    _view["title"] = ""
+    _view["genre"] = ""
+    # Reset progress so stale duration/elapsed don't outlive the session
+    state["progress_start"] = state["progress_current"] = state["progress_end"] = 0
+    _view["duration"] = _view["elapsed"] = _view["remaining"] = 0
+    # Reassigning under the lock drops the last reference to the cover
+    # blob, so CPython frees the (potentially MB-sized) buffer right away
+    with _cover_lock:
+        _cover.data = b""
+        _cover.version += 1
+    _view["has_cover"] = False
+    _view["cover_version"] = _cover.version
+    state["version"] += 1
+    print("Playback session ended")
+
+
+def _handle_play_start(payload):
+    _view["active"] = True
+    state["version"] += 1
+
+
+def _handle_play_end(payload):
+    pass  # Keep metadata visible after song ends
+
+
+def _handle_pend(payload):
+    # Playback ended/paused - keep metadata but stop progress
+    _view["active"] = False
+    state["version"] += 1
+
+
+def _handle_shsw(payload):
+    # Shuffle state: 0=off, 1=on
+    try:
+        _view["shuffle"] = (int(payload.decode("utf-8")) == 1)
+        state["version"] += 1
+    except (ValueError, UnicodeDecodeError):
+        pass
+
+
+def _handle_rpte(payload):
+    # Repeat state: 0=off, 1=one, 2=all
+    try:
+        _view["repeat"] = (int(payload.decode("utf-8")) > 0)
+        state["version"] += 1
+    except (ValueError, UnicodeDecodeError):
+        pass
+
+
+# Dispatch table: topic_key (final segment, e.g. "prgr" from "ssnc/prgr")
+# to handler. One dict lookup per message instead of an elif chain.
+HANDLERS = {
+    "artist": _set_str("artist"),
+    "album": _set_str("album"),
+    "title": _set_str("title"),
+    "genre": _set_str("genre"),
+    "volume": _handle_volume,
+    "client_name": _set_str("client_name"),
+    "cover": _handle_cover,
+    "prgr": _handle_prgr,
+    "active_start": _handle_active_start,
+    "active_end": _handle_active_end,
+    "play_start": _handle_play_start,
+    "play_end": _handle_play_end,
+    "pbeg": _handle_play_start,  # Playback began
+    "pend": _handle_pend,
+    "shsw": _handle_shsw,
+    "rpte": _handle_rpte,
+}
+
+# Bound method for the hot path: HANDLERS.get doubles as the known-key
+# membership test, rejecting unhandled topics in one O(1) lookup
+_get_handler = HANDLERS.get
 
 
 def on_message(client, userdata, msg):
     """Callback when MQTT message received."""
     topic = msg.topic
-    base_topic = config["mqtt"]["topic"]
 
     # Extract the subtopic (everything after base topic)
-    if topic.startswith(base_topic + "/"):
-        subtopic = topic[len(base_topic) + 1:]
-    else:
+    if not topic.startswith(BASE_TOPIC_SLASH):
         return
+    subtopic = topic[BASE_TOPIC_SLASH_LEN:]
 
-    # Get the final part of the subtopic (handles ssnc/xxx nesting)
-    topic_key = subtopic.split("/")[-1]
-
-    # Track whether we should notify clients (skip for volume-only updates during playback)
-    should_notify = True
-
-    # Handle different message types (topic_key is final segment, e.g. "prgr" from "ssnc/prgr")
-    if topic_key == "artist":
-        state["artist"] = msg.payload.decode("utf-8", errors="ignore")
-    elif topic_key == "album":
-        state["album"] = msg.payload.decode("utf-8", errors="ignore")
-    elif topic_key == "title":
-        state["title"] = msg.payload.decode("utf-8", errors="ignore")
-    elif topic_key == "genre":
-        state["genre"] = msg.payload.decode("utf-8", errors="ignore")
-    elif topic_key == "volume":
-        state["volume"] = msg.payload.decode("utf-8", errors="ignore")
-        # Don't notify for volume-only changes to avoid resetting progress display
-        should_notify = False
-    elif topic_key == "client_name":
-        state["client_name"] = msg.payload.decode("utf-8", errors="ignore")
-    elif topic_key == "cover":
-        # Cover art is sent as binary data
-        if msg.payload and len(msg.payload) > 0:
-            state["cover_art"] = msg.payload
-            state["cover_version"] += 1
-            # Detect image type from magic bytes
-            if msg.payload[:3] == b'\xff\xd8\xff':
-                state["cover_art_type"] = "image/jpeg"
-            elif msg.payload[:8] == b'\x89PNG\r\n\x1a\n':
-                state["cover_art_type"] = "image/png"
-    elif topic_key == "prgr":
-        # Progress: "start/current/end" as RTP timestamps
-        try:
-            parts = msg.payload.decode("utf-8").split("/")
-            if len(parts) == 3:
-                state["progress_start"] = int(parts[0])
-                state["progress_current"] = int(parts[1])
-                state["progress_end"] = int(parts[2])
-                # Receiving progress means we're actively playing
-                state["active"] = True
-        except (ValueError, UnicodeDecodeError):
-            pass
-    elif topic_key == "active_start":
-        state["active"] = True
-        print("Playback session started")
-    elif topic_key == "active_end":
-        state["active"] = False
-        # Clear metadata on session end
-        state["artist"] = ""
-        state["album"] = ""
-        state["title"] = ""
-        state["genre"] = ""
-        state["cover_art"] = None
-        state["cover_version"] += 1
-        print("Playback session ended")
-    elif topic_key == "play_start":
-        state["active"] = True
-    elif topic_key == "play_end":
-        pass  # Keep metadata visible after song ends
-    elif topic_key == "pbeg":
-        # Playback began
-        state["active"] = True
-    elif topic_key == "pend":
-        # Playback ended/paused - keep metadata but stop progress
-        state["active"] = False
-    elif topic_key == "shsw":
-        # Shuffle state: 0=off, 1=on
-        try:
-            shuffle_value = int(msg.payload.decode("utf-8"))
-            state["shuffle"] = (shuffle_value == 1)
-        except (ValueError, UnicodeDecodeError):
-            pass
-    elif topic_key == "rpte":
-        # Repeat state: 0=off, 1=one, 2=all
-        try:
-            repeat_value = int(msg.payload.decode("utf-8"))
-            state["repeat"] = (repeat_value > 0)
-        except (ValueError, UnicodeDecodeError):
-            pass
-    else:
+    # Get the final part of the subtopic (handles ssnc/xxx nesting);
+    # rpartition avoids the list allocation of split("/")[-1]
+    topic_key = subtopic.rpartition("/")[2]
+
+    handler = _get_handler(topic_key)
+    if handler is None:
         # Unknown topic, don't notify
-        should_notify = False
+        return
 
-    # Notify all connected SSE clients of state change (except for volume-only updates)
-    if should_notify:
+    # Notify all connected SSE clients of state change (except for
+    # volume-only updates, whose handler returns False)
+    if handler(msg.payload) is not False:
         notify_clients()
 
 
@@ -216,10 +416,16 @@ def on_disconnect(client, userdata, disconnect_flags, reason_code, properties=No
 
 def setup_mqtt():
     """Initialize and connect MQTT client."""
-    global mqtt_client
+    global mqtt_client, BASE_TOPIC_SLASH, BASE_TOPIC_SLASH_LEN, REMOTE_TOPIC
 
     mqtt_config = config["mqtt"]
 
+    # Cache topic strings so the hot message path avoids per-message
+    # config lookups and concatenations
+    BASE_TOPIC_SLASH = mqtt_config["topic"] + "/"
+    BASE_TOPIC_SLASH_LEN = len(BASE_TOPIC_SLASH)
+    REMOTE_TOPIC = mqtt_config["topic"] + "/remote"
+
     # Create client with hostname-based unique ID
     base_client_id = mqtt_config.get("client_id", "shairport-web")
     client_id = f"{base_client_id}-{socket.gethostname()}"
@@ -235,6 +441,11 @@ def setup_mqtt():
     mqtt_client.on_message = on_message
     mqtt_client.on_disconnect = on_disconnect
 
+    # Generous publish windows so control publishes from Flask worker
+    # threads queue instead of stalling behind paho's network loop
+    mqtt_client.max_inflight_messages_set(128)
+    mqtt_client.max_queued_messages_set(1024)
+
     # Set authentication if provided
     username = mqtt_config.get("username", "")
     password = mqtt_config.get("password", "")
@@ -253,6 +464,33 @@ def setup_mqtt():
         print(f"Failed to connect to MQTT broker: {e}")
 
 
+# Don't bother gzipping tiny responses; headers outweigh the savings
+COMPRESS_MIN_SIZE = 256
+
+
+@app.after_request
+def compress_response(response):
+    """gzip JSON responses when the client accepts it.
+
+    JSON is highly compressible (mostly repeated ASCII field names).
+    Streamed responses (SSE) and /api/cover are left alone: buffering
+    would break SSE latency, and image formats are already compressed
+    so gzip would only waste CPU.
+    """
+    if (response.mimetype != "application/json"
+            or response.direct_passthrough
+            or response.content_length is None
+            or response.content_length < COMPRESS_MIN_SIZE
+            or "Content-Encoding" in response.headers
+            or "gzip" not in request.headers.get("Accept-Encoding", "").lower()):
+        return response
+
+    response.set_data(gzip.compress(response.get_data(), compresslevel=5))
+    response.headers["Content-Encoding"] = "gzip"
+    response.headers.add("Vary", "Accept-Encoding")
+    return response
+
+
 @app.route("/")
 def index():
     """Render the main web interface."""
@@ -262,30 +500,30 @@ def index():
 @app.route("/api/state")
 def get_state():
     """Return current playback state as JSON."""
-    return jsonify(get_state_dict())
+    return Response(json_dumps_bytes(get_state_dict()), mimetype="application/json")
 
 
 @app.route("/api/events")
 def events():
     """Server-Sent Events endpoint for real-time updates."""
     def stream():
-        client_queue = queue.Queue(maxsize=10)
-        sse_clients.append(client_queue)
+        # Size-1 slot: only the latest state snapshot matters
+        client_queue = queue.Queue(maxsize=1)
+        sse_clients.add(client_queue)
         try:
             # Send initial state immediately
-            yield f"data: {json.dumps(get_state_dict())}\n\n"
+            yield b"data: " + json_dumps_bytes(get_state_dict()) + b"\n\n"
             while True:
                 try:
                     message = client_queue.get(timeout=30)
                     yield message
                 except queue.Empty:
                     # Send keepalive comment to prevent timeout
-                    yield ": keepalive\n\n"
+                    yield b": keepalive\n\n"
         except GeneratorExit:
             pass
         finally:
-            if client_queue in sse_clients:
-                sse_clients.remove(client_queue)
+            sse_clients.discard(client_queue)
 
     response = Response(stream(), mimetype="text/event-stream")
     response.headers["Cache-Control"] = "no-cache"
@@ -296,12 +534,29 @@ def events():
 
 @app.route("/api/cover")
 def get_cover():
-    """Return current cover art image."""
-    if state["cover_art"]:
-        return Response(
-            state["cover_art"],
-            mimetype=state["cover_art_type"]
-        )
+    """Return current cover art image.
+
+    The UI requests /api/cover?v={cover_version}, so those responses
+    are immutable per URL and can be cached indefinitely; a version
+    bump changes the URL (versions are restart-unique, see _cover).
+    The bare URL used on initial page load revalidates via ETag
+    instead, since its content changes under the same URL.
+    """
+    with _cover_lock:
+        data = _cover.data
+        mime = _cover.mime
+        version = _cover.version
+    if data:
+        etag = f'W/"v{version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return "", 304
+        response = Response(data, mimetype=mime)
+        response.headers["ETag"] = etag
+        if request.args.get("v"):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
     else:
         # Redirect to placeholder
         return redirect("/static/placeholder.svg")
@@ -346,13 +601,16 @@ def control(command):
     if not dacp_command:
         return jsonify({"error": f"Unknown command: {command}"}), 400
 
-    # Publish to the remote control topic
-    base_topic = config["mqtt"]["topic"]
-    remote_topic = f"{base_topic}/remote"
-
     try:
-        mqtt_client.publish(remote_topic, dacp_command)
-        return jsonify({"success": True, "command": dacp_command})
+        # Publish to the remote control topic (cached at setup time).
+        # QoS 0 fire-and-forget: don't wait for the network loop, just
+        # report whether paho accepted the message.
+        info = mqtt_client.publish(REMOTE_TOPIC, dacp_command, qos=0)
+        return jsonify({
+            "success": info.rc == mqtt.MQTT_ERR_SUCCESS,
+            "command": dacp_command,
+            "mid": info.mid,
+        })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -363,6 +621,8 @@ def init_app():
     if config is None:
         config = load_config()
         setup_mqtt()
+        # Start the SSE broadcaster thread
+        threading.Thread(target=broadcast_loop, daemon=True).start()
 
 
 # Initialize on module load for Gunicorn compatibility
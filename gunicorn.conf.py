@@ -1,13 +1,27 @@
 import yaml
 
+# Prefer the libyaml-backed loader for faster startup parsing
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 # Load config from config.yaml
 with open("config.yaml") as f:
-    _cfg = yaml.safe_load(f)
+    _cfg = yaml.load(f, Loader=_YamlSafeLoader)
 
 _server = _cfg.get("server", {})
 bind = f"{_server.get('host', '0.0.0.0')}:{_server.get('port', 5000)}"
 workers = 1  # Single worker to share MQTT state
-worker_class = "gthread"  # Threaded worker for SSE
-threads = 4  # Multiple threads for handling SSE connections
+# gevent worker when available: each SSE connection is a greenlet
+# instead of an OS thread, so idle clients cost kilobytes rather than
+# a pool thread each. Falls back to the threaded worker otherwise.
+try:
+    import gevent  # noqa: F401
+    worker_class = "gevent"
+    worker_connections = 2000
+except ImportError:
+    worker_class = "gthread"
+    threads = 32
 timeout = 120  # Long timeout for SSE connections
 keepalive = 65  # Keep connections alive